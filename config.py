@@ -1,4 +1,5 @@
 import os
+from typing import Dict
 
 
 class Config:
@@ -8,8 +9,30 @@ class Config:
     )
     DATABASE_NAME: str = os.getenv("DATABASE_NAME", "openf1")
     OPENF1_BASE_URL: str = "https://api.openf1.org/v1"
-    BATCH_SIZE: int = 5000
+    # Upper bound per bulk write; the driver splits it further by
+    # maxWriteBatchSize / maxMessageSizeBytes, so each round trip stays near the wire limit
+    MAX_DOCS_PER_INSERT: int = 50000
+    # Documents per insert_many; small time-series docs tolerate much larger batches
+    BATCH_SIZES: Dict[str, int] = {
+        "positions": 20000,
+        "intervals": 20000,
+        "laps": 5000,
+        "car_data": MAX_DOCS_PER_INSERT,
+        "drivers": 500,
+    }
     MAX_CONCURRENT_REQUESTS: int = 5
+    # Retries for a request answered with 429 Too Many Requests
+    RATE_LIMIT_RETRIES: int = 3
+    # Unacknowledged writes for car_data/positions/intervals; safe because their
+    # _ids are deterministic, so a re-run fills in anything that was lost
+    FAST_INSERT_MODE: bool = os.getenv("FAST_INSERT_MODE", "false").lower() == "true"
+    # Local zstd copies of OpenF1 responses, reused until they expire
+    CACHE_DIR: str = os.getenv("OPENF1_CACHE_DIR", "./cache")
+    CACHE_TTL_SECONDS: int = int(os.getenv("OPENF1_CACHE_TTL_SECONDS", 24 * 60 * 60))
+    # Seconds between ingestion progress log lines
+    PROGRESS_INTERVAL_SECONDS: float = 5.0
+    # Equal time slices each driver's car data is fetched in
+    CAR_DATA_TIME_WINDOWS: int = 4
 
 
 config = Config()
@@ -1,41 +1,94 @@
 import asyncio
+import collections
 import aiohttp
-from typing import Dict, Any, List
+import ijson
+import msgspec
+import orjson
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple, Type
 from loguru import logger
-from datetime import datetime
+from datetime import datetime, timezone
+from pydantic import TypeAdapter, ValidationError
 
 from database import F1Database
-from models import Session, Driver, Lap, CarData, Position, Interval
+from response_cache import ResponseCache
+from throttle import Throttle
+from models import (
+    DriverListAdapter,
+    LapRecord,
+    LapSegmentsRecord,
+    has_lap_segments,
+    PositionRecord,
+    IntervalRecord,
+    CarDataRecord,
+)
 from config import config
 
 class TestDataIngestion:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.db = F1Database()
         self.session = None
+        # Local copies of OpenF1 responses so re-runs don't re-download sessions
+        self.cache = ResponseCache(enabled=use_cache)
+        # Caps in-flight OpenF1 requests; shrinks on 429s and recovers on success
+        self._throttle = Throttle(config.MAX_CONCURRENT_REQUESTS)
+        # Raw driver lists per session, reused by car data ingestion
+        self._drivers_cache: Dict[int, List[dict]] = {}
+        # Raw session metadata per session, used to window car data queries
+        self._sessions_cache: Dict[int, dict] = {}
+        # Documents processed per collection, reported periodically by _report_progress
+        self._stats: collections.Counter = collections.Counter()
+        # Validation failures per (data type, exception class), reported once at the end
+        self._errors: collections.Counter = collections.Counter()
+        self._error_samples: Dict[Tuple[str, str], str] = {}
         
     async def __aenter__(self):
         await self.db.connect()
-        await self.db.ensure_indexes()
-        self.session = aiohttp.ClientSession()
+        try:
+            # Dedup indexes must be in place before anything is dropped; this
+            # raises rather than loading into collections that can't deduplicate
+            await self.db.ensure_unique_indexes()
+            await self.db.verify_dedup_indexes()
+        except Exception:
+            await self.db.disconnect()
+            raise
+        # Secondary indexes are rebuilt after the load; only dedup indexes stay live
+        await self.db.drop_secondary_indexes()
+        # Keep-alive pool sized to our concurrency so fan-out requests reuse TLS connections
+        connector = aiohttp.TCPConnector(
+            limit=config.MAX_CONCURRENT_REQUESTS,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=120)
+        )
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Report validation failures from any entry point not yet summarised
+        self._log_error_summary()
         if self.session:
             await self.session.close()
-        await self.db.disconnect()
+        try:
+            # Rebuild query indexes in one pass after the bulk load, even if it
+            # failed part way, so the database is never left without them
+            await self.db.ensure_secondary_indexes()
+        finally:
+            await self.db.disconnect()
     
     async def fetch_latest_session(self) -> Dict[str, Any]:
         """Fetch the latest race session"""
         url = f"{config.OPENF1_BASE_URL}/sessions?session_type=Race&year=2024"
         
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                sessions = await response.json()
-                if sessions:
-                    # Get the most recent race
-                    latest_session = max(sessions, key=lambda x: x['date_start'])
-                    logger.info(f"Found latest race: {latest_session['session_name']} - {latest_session['location']}")
-                    return latest_session
+        sessions = await self._fetch_json(url)
+        if sessions:
+            # Get the most recent race
+            latest_session = max(sessions, key=lambda x: x['date_start'])
+            self._sessions_cache[latest_session['session_key']] = latest_session
+            logger.info(f"Found latest race: {latest_session['session_name']} - {latest_session['location']}")
+            return latest_session
         
         raise Exception("Could not fetch latest session")
     
@@ -43,15 +96,26 @@ class TestDataIngestion:
         """Ingest all data for a specific session"""
         logger.info(f"Starting data ingestion for session {session_key}")
         
-        # Ingest different data types sequentially to see progress
-        logger.info("Ingesting drivers...")
-        drivers_count = await self.ingest_drivers(session_key)
-        
-        logger.info("Ingesting laps...")
-        laps_count = await self.ingest_laps(session_key)
-
-        logger.info("Ingesting positions...")
-        positions_count = await self.ingest_positions(session_key)
+        # Progress is logged from counter snapshots rather than inside the hot loops
+        reporter = asyncio.create_task(self._report_progress(config.PROGRESS_INTERVAL_SECONDS))
+        try:
+            # Drivers, laps and positions are independent, so fetch them concurrently.
+            # TaskGroup cancels and awaits the others if one fails, so nothing keeps
+            # writing after __aexit__ has rebuilt indexes and disconnected.
+            logger.info("Ingesting drivers, laps and positions...")
+            async with asyncio.TaskGroup() as group:
+                drivers_task = group.create_task(self.ingest_drivers(session_key))
+                laps_task = group.create_task(self.ingest_laps(session_key))
+                positions_task = group.create_task(self.ingest_positions(session_key))
+            drivers_count = drivers_task.result()
+            laps_count = laps_task.result()
+            positions_count = positions_task.result()
+        except ExceptionGroup as group_error:
+            # Surface the underlying failure rather than the group wrapper
+            raise group_error.exceptions[0] from group_error
+        finally:
+            reporter.cancel()
+        self._log_error_summary()
         
         # logger.info("Ingesting intervals...")
         # intervals_count = await self.ingest_intervals(session_key)
@@ -69,6 +133,8 @@ class TestDataIngestion:
         # logger.info(f"Intervals: {intervals_count}")
         # logger.info(f"Car Data: {car_data_count}")
 
+        # Make sure any unacknowledged writes have landed before counting
+        await self.db.flush_writes()
         stats = await self.db.get_collection_stats()
         logger.info("\nDATABASE STATISTICS:")
         for collection, count in stats.items():
@@ -78,22 +144,16 @@ class TestDataIngestion:
         """Ingest driver data"""
         url = f"{config.OPENF1_BASE_URL}/drivers?session_key={session_key}"
         
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                data = await response.json()
-                logger.info(f"  Fetched {len(data)} drivers from API")
-                
-                drivers = []
-                for item in data:
-                    try:
-                        driver = Driver(**item)
-                        drivers.append(driver.model_dump())
-                    except Exception as e:
-                        logger.warning(f"Error processing driver {item.get('driver_number', 'unknown')}: {e}")
-                
-                count = await self.db.bulk_insert("drivers", drivers)
-                logger.info(f" Stored {count} drivers in database")
-                return count
+        data = await self._fetch_json(url)
+        if data is not None:
+            self._drivers_cache[session_key] = data
+            logger.info(f"  Fetched {len(data)} drivers from API")
+            
+            drivers, _ = self._validate_batch(DriverListAdapter, data, "driver", 0)
+            
+            count = await self.db.bulk_insert("drivers", drivers)
+            logger.info(f" Stored {count} drivers in database")
+            return count
 
         logger.error(" Failed to fetch drivers data")
         return 0
@@ -102,42 +162,18 @@ class TestDataIngestion:
         """Ingest lap data"""
         url = f"{config.OPENF1_BASE_URL}/laps?session_key={session_key}"
         
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                data = await response.json()
-                
-                laps = []
-                for item in data:
-                    try:
-                        # Convert date string to datetime if needed
-                        if isinstance(item.get('date_start'), str):
-                            item['date_start'] = datetime.fromisoformat(item['date_start'].replace('Z', '+00:00'))
-                        
-                        lap = Lap(**item)
-                        laps.append(lap.model_dump())
-                        
-                        if len(laps) >= config.BATCH_SIZE:
-                            await self.db.bulk_insert("laps", laps)
-                            laps = []
-                            logger.debug(f"  Processed batch of {config.BATCH_SIZE} laps")
-                            
-                    except Exception as e:
-                        # Only show first 3 errors to avoid spam
-                        if len(laps) < 3:
-                            logger.warning(f"Error processing lap data for driver {item.get('driver_number', 'unknown')}: {str(e)[:100]}...")
-                        elif len(laps) == 3:
-                            logger.warning("More lap validation errors found... (suppressing further messages)")
-                
-                # Insert remaining laps
-                if laps:
-                    await self.db.bulk_insert("laps", laps)
-                
-                # Insert remaining laps
-                if laps:
-                    await self.db.bulk_insert("laps", laps)
+        async with self._open_stream(url) as content:
+            if content is not None:
+                # Bulky segment arrays go to their own collection to keep laps lean
+                successful_count, error_count = await self._run_ingest_pipeline(
+                    content,
+                    "laps",
+                    LapRecord,
+                    "lap",
+                    extra_outputs=[("lap_segments", LapSegmentsRecord, "lap segment", has_lap_segments)],
+                )
                 
-                total_count = len(data)
-                successful_count = len([item for item in data if self._validate_lap_item(item)])
+                total_count = successful_count + error_count
                 logger.info(f"   Processed {successful_count}/{total_count} laps successfully")
                 return successful_count
         
@@ -148,33 +184,14 @@ class TestDataIngestion:
         """Ingest position data"""
         url = f"{config.OPENF1_BASE_URL}/position?session_key={session_key}"
         
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                data = await response.json()
+        async with self._open_stream(url) as content:
+            if content is not None:
+                successful_count, _ = await self._run_ingest_pipeline(
+                    content, "positions", PositionRecord, "position"
+                )
                 
-                positions = []
-                for item in data:
-                    try:
-                        if isinstance(item.get('date'), str):
-                            item['date'] = datetime.fromisoformat(item['date'].replace('Z', '+00:00'))
-                        
-                        position = Position(**item)
-                        positions.append(position.model_dump())
-                        
-                        if len(positions) >= config.BATCH_SIZE:
-                            await self.db.bulk_insert("positions", positions)
-                            positions = []
-                            logger.debug(f" Processed batch of {config.BATCH_SIZE} positions")
-                            
-                    except Exception as e:
-                        logger.warning(f"Error processing position data: {e}")
-                
-                if positions:
-                    await self.db.bulk_insert("positions", positions)
-                
-                total_count = len(data)
-                logger.info(f"Ingested {total_count} position records")
-                return total_count
+                logger.info(f"Ingested {successful_count} position records")
+                return successful_count
         
         logger.error("Failed to fetch position data")
         return 0
@@ -183,45 +200,13 @@ class TestDataIngestion:
         """Ingest interval data"""
         url = f"{config.OPENF1_BASE_URL}/intervals?session_key={session_key}"
         
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                data = await response.json()
-                logger.info(f" Fetched {len(data)} intervals from API")
-                
-                intervals = []
-                progress_count = 0 
-                for item in data:
-                    try:
-                        if isinstance(item.get('date'), str):
-                            item['date'] = datetime.fromisoformat(item['date'].replace('Z', '+00:00'))
-                        
-                        interval = Interval(**item)
-                        intervals.append(interval.model_dump())
-                        
-                        if len(intervals) >= config.BATCH_SIZE:
-                            await self.db.bulk_insert("intervals", intervals)
-                            intervals = []
-                            progress_count += config.BATCH_SIZE
-                            if progress_count % (config.BATCH_SIZE * 5) == 0:  # Show progress every 5k records
-                                logger.info(f" Progress: {progress_count:,}/{len(data):,} intervals processed")
-                            
-                    except Exception as e:
-                        # Only show first 3 errors to avoid spam
-                        if len(intervals) < 3:
-                            gap_value = item.get('gap_to_leader', 'unknown')
-                            interval_value = item.get('interval', 'unknown')
-                            logger.warning(f"Error processing interval data for driver {item.get('driver_number', 'unknown')}: gap='{gap_value}', interval='{interval_value}'")
-                        elif len(intervals) == 3:
-                            logger.warning("More interval validation errors found... (suppressing further messages)")
+        async with self._open_stream(url) as content:
+            if content is not None:
+                successful_count, error_count = await self._run_ingest_pipeline(
+                    content, "intervals", IntervalRecord, "interval"
+                )
                 
-                if intervals:
-                    await self.db.bulk_insert("intervals", intervals)
-                
-                if intervals:
-                    await self.db.bulk_insert("intervals", intervals)
-                
-                total_count = len(data)
-                successful_count = len([item for item in data if self._validate_interval_item(item)])
+                total_count = successful_count + error_count
                 logger.info(f" Processed {successful_count}/{total_count} intervals successfully")
                 return successful_count
         
@@ -237,54 +222,78 @@ class TestDataIngestion:
     
     async def _ingest_car_data_by_drivers(self, session_key: int):
         """Fallback method: fetch car data for each driver individually"""
-        # First get all drivers for this session
-        drivers_url = f"{config.OPENF1_BASE_URL}/drivers?session_key={session_key}"
-        
-        async with self.session.get(drivers_url) as response:
-            if response.status != 200:
+        # First get all drivers for this session, reusing ingest_drivers' response if we have it
+        drivers_data = self._drivers_cache.get(session_key)
+        if drivers_data is None:
+            drivers_url = f"{config.OPENF1_BASE_URL}/drivers?session_key={session_key}"
+            
+            drivers_data = await self._fetch_json(drivers_url)
+            if drivers_data is None:
                 logger.error(" Failed to fetch drivers for car data ingestion")
                 return 0
-                
-            drivers_data = await response.json()
-            if not drivers_data:
-                logger.warning(" No drivers found for this session")
-                return 0
+            self._drivers_cache[session_key] = drivers_data
         
-        total_car_data = 0
-        logger.info(f" Found {len(drivers_data)} drivers, fetching car data for each...")
-
-        # Fetch car data for each driver
-        for i, driver in enumerate(drivers_data, 1):
-            driver_number = driver.get('driver_number')
-            if not driver_number:
-                continue
-
-            logger.debug(f" Fetching car data for driver {driver_number} ({i}/{len(drivers_data)})")
+        if not drivers_data:
+            logger.warning(" No drivers found for this session")
+            return 0
+        
+        driver_numbers = [driver['driver_number'] for driver in drivers_data if driver.get('driver_number')]
+        logger.info(f" Found {len(driver_numbers)} drivers, fetching car data for each...")
 
-            # Use speed filters to avoid "too much data" errors
-            driver_total = 0
-            speed_filters = [
-                "speed=0",
-                "speed>=1&speed<150",
-                "speed>=150&speed<350",
-                "speed>=350"
-            ]
-            
-            # Try each speed filter
-            for speed_filter in speed_filters:
-                car_data_url = f"{config.OPENF1_BASE_URL}/car_data?session_key={session_key}&driver_number={driver_number}&{speed_filter}"
-                
-                async with self.session.get(car_data_url) as driver_response:
-                    if driver_response.status == 200:
-                        driver_data = await driver_response.json()
-                        if driver_data:
-                            logger.debug(f" Got {len(driver_data)} records for driver {driver_number}")
-                            processed_count = await self._process_car_data_batch(driver_data)
-                            total_car_data += processed_count
-                        else:
-                            logger.debug(f" No car data for driver {driver_number}")
-                    else:
-                        logger.debug(f"  Failed to fetch car data for driver {driver_number}")
+        # Split the session into time windows to avoid "too much data" errors;
+        # OpenF1 indexes car data by date, so these are cheaper than speed filters
+        date_filters = await self._car_data_date_filters(session_key)
+        if not date_filters:
+            logger.error(" Failed to fetch session window for car data ingestion")
+            return 0
+        
+        jobs = [
+            (driver_number, date_filter)
+            for driver_number in driver_numbers
+            for date_filter in date_filters
+        ]
+        # A fixed pool of fetchers feeds a bounded queue, so at most a few fetched
+        # responses wait in memory while batches are written
+        results_q = asyncio.Queue(maxsize=4)
+        batch_size = config.BATCH_SIZES["car_data"]
+        total_car_data = 0
+        error_count = 0
+        
+        async def fetch_worker():
+            while jobs:
+                driver_number, date_filter = jobs.pop()
+                try:
+                    data = await self._fetch_car_data(session_key, driver_number, date_filter)
+                except Exception as e:
+                    logger.warning(f"  Failed to fetch car data for driver {driver_number}: {e}")
+                    continue
+                await results_q.put(data)
+        
+        async def fetch_all():
+            await asyncio.gather(*(fetch_worker() for _ in range(config.MAX_CONCURRENT_REQUESTS)))
+            await results_q.put(None)
+        
+        async def write():
+            # Results share one accumulator that is flushed in full batches as they arrive
+            nonlocal total_car_data, error_count
+            pending = []
+            while (data := await results_q.get()) is not None:
+                pending.extend(data)
+                while len(pending) >= batch_size:
+                    processed_count, error_count = await self._process_car_data_batch(pending[:batch_size], error_count)
+                    total_car_data += processed_count
+                    pending = pending[batch_size:]
+            if pending:
+                processed_count, error_count = await self._process_car_data_batch(pending, error_count)
+                total_car_data += processed_count
+        
+        tasks = [asyncio.create_task(fetch_all()), asyncio.create_task(write())]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # If the writer fails the fetchers would block on the full queue forever
+            for task in tasks:
+                task.cancel()
 
         if total_car_data > 0:
             logger.info(f" Processed {total_car_data} car data records across all drivers")
@@ -293,63 +302,217 @@ class TestDataIngestion:
 
         return total_car_data
     
-    async def _process_car_data_batch(self, data: List[Dict]):
-        """Process a batch of car data records"""
-        car_data_records = []
-        successful_count = 0
-        
-        for item in data:
+    @asynccontextmanager
+    async def _get(self, url: str):
+        """GET url under the throttle, backing off and retrying when rate limited"""
+        for attempt in range(config.RATE_LIMIT_RETRIES + 1):
+            async with self._throttle, self.session.get(url) as response:
+                if response.status != 429 or attempt == config.RATE_LIMIT_RETRIES:
+                    if response.status == 200:
+                        await self._throttle.record_success()
+                    yield response
+                    return
+                await self._throttle.backoff()
+            await asyncio.sleep(2 ** attempt)
+    
+    async def _fetch_json(self, url: str) -> Optional[Any]:
+        """GET a JSON endpoint, served from the local cache when possible; None on HTTP errors"""
+        raw = self.cache.get(url)
+        if raw is None:
+            async with self._get(url) as response:
+                if response.status != 200:
+                    return None
+                raw = await response.read()
+            self.cache.put(url, raw)
+        return orjson.loads(raw)
+    
+    @asynccontextmanager
+    async def _open_stream(self, url: str):
+        """Yield an async readable over a JSON response body, or None if the request failed"""
+        reader = self.cache.open_reader(url)
+        if reader is not None:
             try:
-                if isinstance(item.get('date'), str):
-                    item['date'] = datetime.fromisoformat(item['date'].replace('Z', '+00:00'))
-                
-                car_data = CarData(**item)
-                car_data_records.append(car_data.model_dump())
-                successful_count += 1
-                
-                if len(car_data_records) >= config.BATCH_SIZE:
-                    await self.db.bulk_insert("car_data", car_data_records)
-                    car_data_records = []
-                    
-            except Exception as e:
-                # Only show first 3 errors to avoid spam
-                if successful_count < 3:
-                    logger.warning(f"Error processing car data for driver {item.get('driver_number', 'unknown')}: {str(e)[:100]}...")
-                elif successful_count == 3:
-                    logger.warning("More car data validation errors found... (suppressing further messages)")
-        
-        # Insert remaining records
-        if car_data_records:
-            await self.db.bulk_insert("car_data", car_data_records)
-        
-        return successful_count
+                yield reader
+            finally:
+                reader.close()
+            return
+        
+        async with self._get(url) as response:
+            if response.status != 200:
+                yield None
+            elif not self.cache.enabled:
+                yield response.content
+            else:
+                reader = self.cache.recording_reader(url, response.content)
+                try:
+                    yield reader
+                    # Reached only if the body was consumed without raising
+                    reader.commit()
+                finally:
+                    reader.close()
     
-    def _validate_lap_item(self, item: dict) -> bool:
-        """Check if a lap item can be validated without errors"""
+    async def _run_ingest_pipeline(
+        self,
+        content,
+        collection_name: str,
+        record_type: Type[msgspec.Struct],
+        label: str,
+        extra_outputs: Sequence[Tuple[str, Type[msgspec.Struct], str, Callable[[Dict], bool]]] = (),
+    ) -> Tuple[int, int]:
+        """Stream, validate and insert a response body as a producer/validator/writer pipeline
+
+        extra_outputs are (collection, record type, label, item filter) tuples for secondary
+        collections derived from the same items; only the primary collection is counted.
+        """
+        batch_size = config.BATCH_SIZES[collection_name]
+        # Bounded queues apply backpressure, so at most a few batches are held in memory
+        items_q = asyncio.Queue(maxsize=4)
+        docs_q = asyncio.Queue(maxsize=4)
+        successful_count = 0
+        error_count = 0
+        extra_error_count = 0
+        
+        async def produce():
+            # Stream items off the wire instead of buffering the whole payload;
+            # ISO dates (including trailing 'Z') are parsed during validation
+            batch = []
+            async for item in ijson.items_async(content, 'item', use_float=True):
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    await items_q.put(batch)
+                    batch = []
+            if batch:
+                await items_q.put(batch)
+            await items_q.put(None)
+        
+        async def validate():
+            nonlocal error_count, extra_error_count
+            while (items := await items_q.get()) is not None:
+                docs, error_count = self._convert_batch(record_type, items, label, error_count)
+                outputs = [(collection_name, docs)]
+                for extra_collection, extra_type, extra_label, keep in extra_outputs:
+                    extra_items = [item for item in items if keep(item)]
+                    extra_docs, extra_error_count = self._convert_batch(
+                        extra_type, extra_items, extra_label, extra_error_count
+                    )
+                    outputs.append((extra_collection, extra_docs))
+                await docs_q.put(outputs)
+            await docs_q.put(None)
+        
+        async def write():
+            nonlocal successful_count
+            while (outputs := await docs_q.get()) is not None:
+                for output_collection, docs in outputs:
+                    await self.db.bulk_insert(output_collection, docs)
+                    self._stats[output_collection] += len(docs)
+                successful_count += len(outputs[0][1])
+        
+        tasks = [asyncio.create_task(stage()) for stage in (produce, validate, write)]
         try:
-            if isinstance(item.get('date_start'), str):
-                item['date_start'] = datetime.fromisoformat(item['date_start'].replace('Z', '+00:00'))
-            Lap(**item)
-            return True
-        except:
-            return False
+            await asyncio.gather(*tasks)
+        finally:
+            # If one stage fails the others would block on their queues forever
+            for task in tasks:
+                task.cancel()
+        
+        return successful_count, error_count
+    
+    async def _car_data_date_filters(self, session_key: int) -> List[str]:
+        """Build date-range query filters splitting the session into equal windows"""
+        session = self._sessions_cache.get(session_key)
+        if session is None:
+            url = f"{config.OPENF1_BASE_URL}/sessions?session_key={session_key}"
+            sessions = await self._fetch_json(url)
+            if not sessions:
+                return []
+            session = self._sessions_cache[session_key] = sessions[0]
+        
+        date_start = datetime.fromisoformat(session['date_start']).astimezone(timezone.utc)
+        date_end = datetime.fromisoformat(session['date_end']).astimezone(timezone.utc)
+        windows = config.CAR_DATA_TIME_WINDOWS
+        step = (date_end - date_start) / windows
+        # Naive UTC timestamps: a '+00:00' offset would need escaping in the query string
+        bounds = [(date_start + step * i).strftime("%Y-%m-%dT%H:%M:%S") for i in range(1, windows)]
+        
+        # Leave the outer windows open-ended so samples just outside the session bounds are kept
+        lower = [None] + bounds
+        upper = bounds + [None]
+        return [
+            "&".join(part for part in (lo and f"date>={lo}", hi and f"date<{hi}") if part)
+            for lo, hi in zip(lower, upper)
+        ]
     
-    def _validate_interval_item(self, item: dict) -> bool:
-        """Check if an interval item can be validated without errors"""
+    async def _fetch_car_data(self, session_key: int, driver_number: int, query_filter: str) -> List[Dict]:
+        """Fetch one filtered slice of a driver's car data"""
+        car_data_url = f"{config.OPENF1_BASE_URL}/car_data?session_key={session_key}&driver_number={driver_number}&{query_filter}"
+        
+        driver_data = await self._fetch_json(car_data_url)
+        if driver_data is not None:
+            return driver_data
+        
+        logger.debug(f"  Failed to fetch car data for driver {driver_number}")
+        return []
+    
+    async def _process_car_data_batch(self, data: List[Dict], error_count: int) -> Tuple[int, int]:
+        """Validate and insert one batch of car data records"""
+        docs, error_count = self._convert_batch(CarDataRecord, data, "car", error_count)
+        await self.db.bulk_insert("car_data", docs)
+        self._stats["car_data"] += len(docs)
+        return len(docs), error_count
+    
+    def _convert_batch(self, record_type: Type[msgspec.Struct], items: List[Dict], label: str, error_count: int) -> Tuple[List[Dict], int]:
+        """Validate a batch of raw API items into msgspec records and return them as dicts"""
         try:
-            if isinstance(item.get('date'), str):
-                item['date'] = datetime.fromisoformat(item['date'].replace('Z', '+00:00'))
-            Interval(**item)
-            return True
-        except:
-            return False
+            records = msgspec.convert(items, List[record_type], strict=False)
+        except msgspec.ValidationError:
+            # The batch error doesn't say which items failed, so fall back to one at a time
+            records = []
+            for item in items:
+                try:
+                    records.append(msgspec.convert(item, record_type, strict=False))
+                except msgspec.ValidationError as e:
+                    error_count += 1
+                    self._record_error(label, e, str(e))
+        
+        # Keep datetimes as-is for BSON; omit_defaults on the records drops None fields
+        return msgspec.to_builtins(records, builtin_types=(datetime,)), error_count
     
-    def _validate_car_data_item(self, item: dict) -> bool:
-        """Check if a car data item can be validated without errors"""
+    def _validate_batch(self, adapter: TypeAdapter, items: List[Dict], label: str, error_count: int) -> Tuple[List[Dict], int]:
+        """Validate a batch of raw API items in one call, dropping and counting invalid ones"""
         try:
-            if isinstance(item.get('date'), str):
-                item['date'] = datetime.fromisoformat(item['date'].replace('Z', '+00:00'))
-            CarData(**item)
-            return True
-        except:
-            return False
\ No newline at end of file
+            return adapter.dump_python(adapter.validate_python(items), exclude_none=True), error_count
+        except ValidationError as e:
+            # Errors are located by list index, so only the offending items are dropped
+            failed = {}
+            for err in e.errors():
+                failed.setdefault(err['loc'][0], err['msg'])
+            for msg in failed.values():
+                self._record_error(label, e, msg)
+            error_count += len(failed)
+        
+        valid = [item for i, item in enumerate(items) if i not in failed]
+        return adapter.dump_python(adapter.validate_python(valid), exclude_none=True), error_count
+    
+    def _record_error(self, label: str, exc: Exception, msg: str):
+        key = (label, type(exc).__name__)
+        self._errors[key] += 1
+        self._error_samples.setdefault(key, msg)
+    
+    def _log_error_summary(self):
+        for (label, exc_name), count in self._errors.items():
+            sample = self._error_samples[(label, exc_name)]
+            logger.warning(f"{count:,} {label} records failed validation ({exc_name}), e.g.: {sample[:100]}")
+        self._errors.clear()
+        self._error_samples.clear()
+    
+    async def _report_progress(self, interval: float):
+        """Log documents processed per collection since the last snapshot"""
+        last = collections.Counter()
+        while True:
+            await asyncio.sleep(interval)
+            snapshot = self._stats.copy()
+            delta = snapshot - last
+            if delta:
+                progress = ", ".join(f"{name}: {snapshot[name]:,} (+{count:,})" for name, count in delta.items())
+                logger.info(f" Progress: {progress}")
+            last = snapshot
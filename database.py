@@ -1,9 +1,26 @@
+import hashlib
+from bson import ObjectId
+from bson.son import SON
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import IndexModel, UpdateOne, ASCENDING
-from typing import List, Dict, Any
+from pymongo import IndexModel, UpdateOne, ASCENDING, WriteConcern
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 from config import config
 
+# Time-series collections keyed by (session_key, driver_number, date)
+TIME_SERIES_COLLECTIONS = {"car_data", "positions", "intervals"}
+TIME_SERIES_KEY = [
+    ("session_key", ASCENDING),
+    ("driver_number", ASCENDING),
+    ("date", ASCENDING),
+]
+
+
+def time_series_id(doc: Dict[str, Any]) -> ObjectId:
+    """Deterministic _id derived from a time-series document's natural key"""
+    key = f"{doc['session_key']}:{doc['driver_number']}:{doc['date'].isoformat()}"
+    return ObjectId(hashlib.blake2b(key.encode(), digest_size=12).digest())
+
 
 class F1Database:
     def __init__(self, connection_string: str = None, database_name: str = None):
@@ -11,6 +28,8 @@ class F1Database:
         self.database_name = database_name or config.DATABASE_NAME
         self.client = None
         self.db = None
+        # Unacknowledged (w=0) handles for idempotent bulk loads, see FAST_INSERT_MODE
+        self.fast_collections = {}
 
     async def connect(self):
         """Establish database connection"""
@@ -18,23 +37,110 @@ class F1Database:
             self.client = AsyncIOMotorClient(self.connection_string)
             self.db = self.client[self.database_name]
             await self.client.admin.command("ping")
+            if config.FAST_INSERT_MODE:
+                # Deterministic _ids make these writes idempotent, so skip the per-batch ack
+                self.fast_collections = {
+                    name: self.db.get_collection(name, write_concern=WriteConcern(w=0))
+                    for name in TIME_SERIES_COLLECTIONS
+                }
             logger.info(f"Connected to MongoDB: {self.database_name}")
             return True
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             return False
 
+    async def flush_writes(self):
+        """Force a round trip on each fast-insert collection after unacknowledged writes"""
+        for collection_name in self.fast_collections:
+            try:
+                await self.db[collection_name].find_one({})
+            except Exception as e:
+                logger.warning(f"Error flushing writes for {collection_name}: {e}")
+
     async def disconnect(self):
         """Close database connection"""
         if self.client:
             self.client.close()
             logger.info("Disconnected from MongoDB")
 
-    async def ensure_indexes(self):
-        """Create indexes for optimal query performance"""
+    async def ensure_unique_indexes(self):
+        """Create the unique indexes needed for deduplication before loading data
+
+        Raises RuntimeError if one can't be built, e.g. because the collection
+        already holds duplicates; the upserts in bulk_insert rely on them.
+        """
+        await self._ensure_unique_index("sessions", [("session_key", ASCENDING)])
+        for collection_name in sorted(TIME_SERIES_COLLECTIONS):
+            # Lets the upserts in bulk_insert find already stored rows via the index
+            await self._ensure_unique_index(collection_name, TIME_SERIES_KEY)
+
+    async def _ensure_unique_index(
+        self, collection_name: str, keys: List[Tuple[str, int]]
+    ):
+        collection = self.db[collection_name]
+        existing = self._find_index(await collection.index_information(), keys)
+        if existing is not None and existing.get("unique"):
+            return
+
+        try:
+            if existing is None:
+                await collection.create_index(keys, unique=True)
+            else:
+                # Convert the old non-unique index in place (MongoDB 6.0+) so the
+                # keys stay indexed even if the conversion fails on duplicates
+                key_pattern = SON(keys)
+                await self.db.command(
+                    "collMod",
+                    collection_name,
+                    index={"keyPattern": key_pattern, "prepareUnique": True},
+                )
+                await self.db.command(
+                    "collMod",
+                    collection_name,
+                    index={"keyPattern": key_pattern, "unique": True},
+                )
+        except Exception as e:
+            if existing is None:
+                # Keep lookups on these keys indexed even though dedup isn't possible
+                await collection.create_index(keys)
+            fields = ", ".join(field for field, _ in keys)
+            raise RuntimeError(
+                f"Could not build unique index on {collection_name} ({fields}); "
+                f"remove duplicate documents before ingesting again: {e}"
+            ) from e
+
+        logger.info(f"Created unique index for {collection_name}")
+
+    async def verify_dedup_indexes(self):
+        """Fail loudly if a time-series collection lacks its unique natural-key index
+
+        bulk_insert upserts on (session_key, driver_number, date); without the
+        index every upsert would be a full collection scan.
+        """
+        for collection_name in sorted(TIME_SERIES_COLLECTIONS):
+            index_info = await self.db[collection_name].index_information()
+            existing = self._find_index(index_info, TIME_SERIES_KEY)
+            if existing is None or not existing.get("unique"):
+                raise RuntimeError(
+                    f"Missing unique (session_key, driver_number, date) index on "
+                    f"{collection_name}; refusing to run unindexed upserts"
+                )
+
+    @staticmethod
+    def _find_index(
+        index_info: Dict[str, Dict[str, Any]], keys: List[Tuple[str, int]]
+    ) -> Optional[Dict[str, Any]]:
+        """Index info whose key pattern matches keys exactly, if any"""
+        wanted = [(field, int(direction)) for field, direction in keys]
+        for info in index_info.values():
+            if [(field, int(direction)) for field, direction in info["key"]] == wanted:
+                return info
+        return None
+
+    async def ensure_secondary_indexes(self):
+        """Create query indexes in a single pass once bulk loading is done"""
         collections_indexes = {
             "sessions": [
-                IndexModel([("session_key", ASCENDING)], unique=True),
                 IndexModel([("meeting_key", ASCENDING)]),
                 IndexModel([("date_start", ASCENDING)]),
             ],
@@ -53,39 +159,41 @@ class F1Database:
                 IndexModel([("session_key", ASCENDING), ("lap_number", ASCENDING)]),
                 IndexModel([("session_key", ASCENDING), ("driver_number", ASCENDING)]),
             ],
-            "car_data": [
+            "lap_segments": [
                 IndexModel(
                     [
                         ("session_key", ASCENDING),
                         ("driver_number", ASCENDING),
-                        ("date", ASCENDING),
+                        ("lap_number", ASCENDING),
                     ]
                 ),
+            ],
+            "car_data": [
                 IndexModel([("session_key", ASCENDING), ("date", ASCENDING)]),
                 IndexModel([("driver_number", ASCENDING), ("date", ASCENDING)]),
             ],
             "positions": [
                 IndexModel([("session_key", ASCENDING), ("date", ASCENDING)]),
-                IndexModel(
-                    [
-                        ("session_key", ASCENDING),
-                        ("driver_number", ASCENDING),
-                        ("date", ASCENDING),
-                    ]
-                ),
             ],
             "intervals": [
                 IndexModel([("session_key", ASCENDING), ("date", ASCENDING)]),
-                IndexModel(
-                    [
-                        ("session_key", ASCENDING),
-                        ("driver_number", ASCENDING),
-                        ("date", ASCENDING),
-                    ]
-                ),
             ],
         }
+        await self._create_indexes(collections_indexes)
 
+    async def drop_secondary_indexes(self):
+        """Drop non-unique indexes so bulk loads don't pay for index maintenance"""
+        for collection_name in await self.db.list_collection_names():
+            try:
+                collection = self.db[collection_name]
+                index_info = await collection.index_information()
+                for index_name, info in index_info.items():
+                    if index_name != "_id_" and not info.get("unique"):
+                        await collection.drop_index(index_name)
+            except Exception as e:
+                logger.warning(f"Error dropping indexes for {collection_name}: {e}")
+
+    async def _create_indexes(self, collections_indexes: Dict[str, List[IndexModel]]):
         for collection_name, indexes in collections_indexes.items():
             try:
                 collection = self.db[collection_name]
@@ -94,6 +202,15 @@ class F1Database:
             except Exception as e:
                 logger.warning(f"Error creating indexes for {collection_name}: {e}")
 
+    async def get_collection_stats(self) -> Dict[str, int]:
+        """Document counts per collection"""
+        stats = {}
+        for collection_name in sorted(await self.db.list_collection_names()):
+            stats[collection_name] = await self.db[
+                collection_name
+            ].estimated_document_count()
+        return stats
+
     async def bulk_insert(
         self,
         collection_name: str,
@@ -105,7 +222,9 @@ class F1Database:
             return 0
 
         try:
-            collection = self.db[collection_name]
+            collection = self.fast_collections.get(
+                collection_name, self.db[collection_name]
+            )
 
             if upsert_key:
                 operations = []
@@ -117,10 +236,38 @@ class F1Database:
                 # This will write to the database
                 result = await collection.bulk_write(operations, ordered=False)
                 inserted_count = result.upserted_count + result.modified_count
+            elif collection_name in TIME_SERIES_COLLECTIONS:
+                # Insert-if-absent on the natural key, which the unique index
+                # backs: the server drops duplicates without building a huge
+                # BulkWriteError on re-runs. Matching on the key rather than
+                # _id also covers rows stored earlier with random ObjectIds.
+                operations = []
+                for doc in documents:
+                    doc["_id"] = time_series_id(doc)
+                    filter_query = {
+                        "session_key": doc["session_key"],
+                        "driver_number": doc["driver_number"],
+                        "date": doc["date"],
+                    }
+                    operations.append(
+                        UpdateOne(filter_query, {"$setOnInsert": doc}, upsert=True)
+                    )
+                # pymongo rejects bypass_document_validation on unacknowledged writes
+                acknowledged = collection.write_concern.acknowledged
+                result = await collection.bulk_write(
+                    operations, ordered=False, bypass_document_validation=acknowledged
+                )
+                # w=0 returns no counts, so report what was sent
+                inserted_count = (
+                    result.upserted_count if acknowledged else len(documents)
+                )
             else:
                 # Regular insert_many with duplicate handling
                 try:
-                    result = await collection.insert_many(documents, ordered=False)
+                    # Documents are already validated client-side, skip server-side validation
+                    result = await collection.insert_many(
+                        documents, ordered=False, bypass_document_validation=True
+                    )
                     inserted_count = len(result.inserted_ids)
                 except Exception as bulk_error:
                     # Handle duplicate key errors silently - just count successful inserts
@@ -131,13 +278,14 @@ class F1Database:
                         duplicates = len(documents) - inserted_count
                         if duplicates > 0:
                             logger.debug(
-                                f"Skipped {duplicates} duplicates in {collection_name}"
+                                "Skipped {} duplicates in {}", duplicates, collection_name
                             )
                     else:
                         raise bulk_error
 
-            logger.info(
-                f"Inserted/Updated {inserted_count} documents in {collection_name}"
+            # Called once per batch; lazy formatting keeps this cheap when DEBUG is off
+            logger.debug(
+                "Inserted/Updated {} documents in {}", inserted_count, collection_name
             )
             return inserted_count
 
@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import sys
 from loguru import logger
@@ -13,11 +14,11 @@ logger.add(
 )
 
 
-async def run_test_ingestion():
+async def run_test_ingestion(use_cache: bool = True):
     """Main function to run test data ingestion"""
     logger.info("Starting test data ingestion...")
 
-    async with TestDataIngestion() as ingestion:
+    async with TestDataIngestion(use_cache=use_cache) as ingestion:
         try:
             # Get latest race session
             latest_session = await ingestion.fetch_latest_session()
@@ -26,7 +27,7 @@ async def run_test_ingestion():
             # Store session metadata from JSON to PYDantic model and insert into DB
             session = Session(**latest_session)
             await ingestion.db.bulk_insert(
-                "sessions", [session.model_dump()], upsert_key="session_key"
+                "sessions", [session.model_dump(exclude_none=True)], upsert_key="session_key"
             )
 
             # Ingest all data for this session
@@ -41,11 +42,19 @@ async def run_test_ingestion():
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="F1 data ingestion from OpenF1")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download from OpenF1 instead of reusing cached responses",
+    )
+    args = parser.parse_args()
+
     logger.info("F1 Data Ingestion Test")
     logger.info("=" * 50)
 
     try:
-        asyncio.run(run_test_ingestion())
+        asyncio.run(run_test_ingestion(use_cache=not args.no_cache))
         logger.success("Test completed successfully!")
 
     except KeyboardInterrupt:
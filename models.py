@@ -1,13 +1,27 @@
-from pydantic import BaseModel, Field, field_validator
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from datetime import datetime
 from typing import Optional, List, Union
 from bson import ObjectId
 
+def parse_gap_value(v):
+    """Parse gap values - keep strings like '+1 LAP' as is, convert numbers to float"""
+    if v is None:
+        return None
+    try:
+        return float(v)
+    except (ValueError, TypeError):
+        # If it fails, keep as string (e.g., "+1 LAP", "+2 LAPS")
+        return v
+
 class BaseF1Model(BaseModel):
     """Base model for all F1 data"""
-    class Config:
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        json_encoders={ObjectId: str},
+        validate_assignment=False,
+        extra="ignore",
+    )
 
 class CarData(BaseF1Model):
     """Car telemetry data - ~3.7Hz sample rate"""
@@ -87,10 +101,7 @@ class Lap(BaseF1Model):
     i1_speed: Optional[int] = None  # Intermediate 1 speed
     i2_speed: Optional[int] = None  # Intermediate 2 speed
     st_speed: Optional[int] = None  # Speed trap speed
-    # Allow mixed types in segments - can contain None values
-    segments_sector_1: Optional[List[Optional[int]]] = None
-    segments_sector_2: Optional[List[Optional[int]]] = None
-    segments_sector_3: Optional[List[Optional[int]]] = None
+    # Mini-sector segments are stored separately, see LapSegmentsRecord
     sectors_sector_1: Optional[float] = None
     sectors_sector_2: Optional[float] = None
     sectors_sector_3: Optional[float] = None
@@ -116,19 +127,7 @@ class Interval(BaseF1Model):
     @classmethod
     def parse_gap_values(cls, v):
         """Parse gap values - keep strings like '+1 LAP' as is, convert numbers to float"""
-        if v is None:
-            return None
-        if isinstance(v, str):
-            # Try to convert to float first
-            try:
-                return float(v)
-            except (ValueError, TypeError):
-                # If it fails, keep as string (e.g., "+1 LAP", "+2 LAPS")
-                return v
-        try:
-            return float(v)
-        except (ValueError, TypeError):
-            return v
+        return parse_gap_value(v)
 
 class PitStop(BaseF1Model):
     """Pit stop data"""
@@ -175,4 +174,78 @@ class Location(BaseF1Model):
     date: datetime
     x: int
     y: int
-    z: int
\ No newline at end of file
+    z: int
+
+# Batch validator for the low-volume driver list
+DriverListAdapter = TypeAdapter(List[Driver])
+
+
+# msgspec mirrors of the high-volume models. They validate and convert to
+# plain dicts in C, which is much cheaper than pydantic on the ingestion hot path.
+# omit_defaults drops unset (None) fields so they aren't stored as BSON nulls.
+class CarDataRecord(msgspec.Struct, omit_defaults=True):
+    session_key: int
+    driver_number: int
+    date: datetime
+    meeting_key: Optional[int] = None
+    rpm: Optional[int] = None
+    speed: Optional[int] = None
+    n_gear: Optional[int] = None
+    throttle: Optional[float] = None
+    brake: Optional[int] = None
+    drs: Optional[int] = None
+
+class LapRecord(msgspec.Struct, omit_defaults=True):
+    session_key: int
+    driver_number: int
+    lap_number: int
+    meeting_key: Optional[int] = None
+    date_start: Optional[datetime] = None
+    lap_duration: Optional[float] = None
+    is_pit_out_lap: Optional[bool] = None
+    stint_number: Optional[int] = None
+    duration_sector_1: Optional[float] = None
+    duration_sector_2: Optional[float] = None
+    duration_sector_3: Optional[float] = None
+    i1_speed: Optional[int] = None
+    i2_speed: Optional[int] = None
+    st_speed: Optional[int] = None
+    sectors_sector_1: Optional[float] = None
+    sectors_sector_2: Optional[float] = None
+    sectors_sector_3: Optional[float] = None
+
+class LapSegmentsRecord(msgspec.Struct, omit_defaults=True):
+    session_key: int
+    driver_number: int
+    lap_number: int
+    meeting_key: Optional[int] = None
+    segments_sector_1: Optional[List[Optional[int]]] = None
+    segments_sector_2: Optional[List[Optional[int]]] = None
+    segments_sector_3: Optional[List[Optional[int]]] = None
+
+def has_lap_segments(item: dict) -> bool:
+    """Whether a raw lap item carries any non-empty segment array"""
+    return bool(
+        item.get("segments_sector_1")
+        or item.get("segments_sector_2")
+        or item.get("segments_sector_3")
+    )
+
+class PositionRecord(msgspec.Struct, omit_defaults=True):
+    session_key: int
+    driver_number: int
+    date: datetime
+    position: int
+    meeting_key: Optional[int] = None
+
+class IntervalRecord(msgspec.Struct, omit_defaults=True):
+    session_key: int
+    driver_number: int
+    date: datetime
+    meeting_key: Optional[int] = None
+    gap_to_leader: Optional[Union[float, str]] = None
+    interval: Optional[Union[float, str]] = None
+
+    def __post_init__(self):
+        self.gap_to_leader = parse_gap_value(self.gap_to_leader)
+        self.interval = parse_gap_value(self.interval)
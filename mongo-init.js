@@ -16,6 +16,7 @@ db.createUser({
 db.createCollection('sessions');
 db.createCollection('drivers');
 db.createCollection('laps');
+db.createCollection('lap_segments');
 db.createCollection('car_data');
 db.createCollection('positions');
 db.createCollection('intervals');
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import zstandard
+from loguru import logger
+
+from config import config
+
+
+class CachedStreamReader:
+    """Async readable over a cached, zstd-compressed response body"""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        self._reader = zstandard.ZstdDecompressor().stream_reader(self._file)
+
+    async def read(self, n: int = -1) -> bytes:
+        return self._reader.read(n)
+
+    def close(self):
+        self._reader.close()
+        self._file.close()
+
+
+class RecordingStreamReader:
+    """Async readable that passes a live response body through while compressing it to the cache"""
+
+    def __init__(self, stream, path: Path):
+        self._stream = stream
+        self._path = path
+        self._tmp_path = path.with_suffix(".part")
+        self._file = open(self._tmp_path, "wb")
+        self._writer = zstandard.ZstdCompressor(level=3).stream_writer(self._file)
+        self._committed = False
+
+    async def read(self, n: int = -1) -> bytes:
+        chunk = await self._stream.read(n)
+        if chunk:
+            self._writer.write(chunk)
+        return chunk
+
+    def commit(self):
+        """Mark the body as fully consumed so close() publishes it to the cache"""
+        self._committed = True
+
+    def close(self):
+        self._writer.close()
+        # Only publish bodies the caller consumed without error; an empty read
+        # doesn't prove the end (ijson probes with read(0)) and a dropped
+        # connection must not leave a truncated body in the cache
+        if self._committed:
+            os.replace(self._tmp_path, self._path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class ResponseCache:
+    """Local zstd-compressed copies of OpenF1 responses, keyed by URL"""
+
+    def __init__(self, directory: str = None, ttl_seconds: int = None, enabled: bool = True):
+        self.directory = Path(directory or config.CACHE_DIR)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.CACHE_TTL_SECONDS
+        self.enabled = enabled
+        if self.enabled:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.directory / f"{digest}.json.zst"
+
+    def _fresh_path(self, url: str) -> Optional[Path]:
+        if not self.enabled:
+            return None
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime <= self.ttl_seconds:
+                return path
+        except FileNotFoundError:
+            pass
+        return None
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Cached body for url, or None if missing or expired"""
+        path = self._fresh_path(url)
+        if path is None:
+            return None
+        logger.debug(f" Cache hit for {url}")
+        with open(path, "rb") as f:
+            return zstandard.ZstdDecompressor().stream_reader(f).read()
+
+    def put(self, url: str, raw: bytes):
+        if not self.enabled:
+            return
+        path = self._path(url)
+        tmp_path = path.with_suffix(".part")
+        tmp_path.write_bytes(zstandard.ZstdCompressor(level=3).compress(raw))
+        os.replace(tmp_path, path)
+
+    def open_reader(self, url: str) -> Optional[CachedStreamReader]:
+        """Streaming reader over the cached body for url, or None if missing or expired"""
+        path = self._fresh_path(url)
+        if path is None:
+            return None
+        logger.debug(f" Cache hit for {url}")
+        return CachedStreamReader(path)
+
+    def recording_reader(self, url: str, stream) -> RecordingStreamReader:
+        """Wrap a live response stream so its body is cached as it is read"""
+        return RecordingStreamReader(stream, self._path(url))
@@ -0,0 +1,55 @@
+import asyncio
+
+from loguru import logger
+
+
+class Throttle:
+    """Concurrency limiter whose limit can be resized while requests are in flight"""
+
+    def __init__(self, cmax: int, ramp_up_after: int = 20):
+        self.max_limit = cmax
+        self.cmax = cmax
+        self.active = 0
+        self.cond = asyncio.Condition()
+        # Successful requests needed before the limit is raised by one after a backoff
+        self.ramp_up_after = ramp_up_after
+        self._successes = 0
+
+    async def acquire(self):
+        async with self.cond:
+            await self.cond.wait_for(lambda: self.active < self.cmax)
+            self.active += 1
+
+    async def release(self):
+        async with self.cond:
+            self.active -= 1
+            self.cond.notify(1)
+
+    async def set_limit(self, cmax: int):
+        """Resize the limit; waiters are re-checked against the new value"""
+        async with self.cond:
+            self.cmax = max(1, cmax)
+            self.cond.notify_all()
+
+    async def backoff(self):
+        """Halve the limit, e.g. after the API answers 429 Too Many Requests"""
+        self._successes = 0
+        await self.set_limit(self.cmax // 2)
+        logger.warning(f" Rate limited by OpenF1, lowering concurrency to {self.cmax}")
+
+    async def record_success(self):
+        """Slowly ramp the limit back up towards its configured maximum"""
+        if self.cmax >= self.max_limit:
+            return
+        self._successes += 1
+        if self._successes >= self.ramp_up_after:
+            self._successes = 0
+            await self.set_limit(self.cmax + 1)
+            logger.debug(f" Raising OpenF1 concurrency to {self.cmax}")
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()